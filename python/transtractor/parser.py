@@ -8,6 +8,16 @@ from .transtractor import LibParser
 from .utils.testing import run_test_protocol
 
 
+def _warn_deprecated_fields(json_file_path: str, warning_msgs: list[str]) -> None:
+    """Emit a DeprecationWarning for each deprecated field in a configuration."""
+    for warning_msg in warning_msgs:
+        warnings.warn(
+            f"Configuration from {json_file_path} uses deprecated field: {warning_msg}",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
 class Parser:
     """A PDF bank statement parser.
 
@@ -36,11 +46,35 @@ class Parser:
         :return: StatementData object representing the parsed bank statement data
         :raises ParseError: If statement is not recognisable or not parsed correctly
         """
-        sd: StatementData = cast(
+        return cast(
             StatementData, self._inner.py_pdf_path_to_py_statement_data(pdf_file_path)
         )
-        sd.set_filename(pdf_file_path)
-        return sd
+
+    def parse_many(
+        self, pdf_file_paths: list[str], workers: int | None = None
+    ) -> list[StatementData | Exception]:
+        """Parse several bank statement PDFs in parallel.
+
+        The PDFs are extracted and parsed by worker threads in a single call
+        to the Rust core. A file that cannot be parsed does not stop the
+        others: its exception is returned in place of its StatementData.
+
+        :param pdf_file_paths: Paths to the PDF files to be processed
+        :param workers: Number of worker threads. Defaults to the number of CPUs.
+        :return: StatementData or raised exception for each PDF file, in the
+            order given
+
+        Example usage::
+
+            results = parser.parse_many(['jan.pdf', 'feb.pdf'])
+            parsed = [r for r in results if not isinstance(r, Exception)]
+        """
+        return cast(
+            list[StatementData | Exception],
+            self._inner.py_pdf_paths_to_py_statement_datas(
+                list(pdf_file_paths), workers
+            ),
+        )
 
     def parse_layout(self, layout_file_path: str) -> StatementData:
         """Parse the bank statement layout string and return a StatementData object.
@@ -100,13 +134,25 @@ class Parser:
 
         # Check for and emit any deprecation warnings
         deprecation_warnings = self._inner.get_deprecation_warnings()
-        for warning_msg in deprecation_warnings:
-            warnings.warn(
-                f"Configuration from {json_file_path} uses deprecated field: "
-                f"{warning_msg}",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+        _warn_deprecated_fields(json_file_path, deprecation_warnings)
+
+    def load_many(self, json_file_paths: list[str]) -> None:
+        """Load multiple custom parsing configurations from JSON files.
+
+        Equivalent to calling :meth:`load` for each file, but all files are
+        registered in a single call to the internal database. If any file is
+        invalid, none of the configurations are loaded.
+
+        :param json_file_paths: Paths to the JSON configuration files
+        :raises ConfigLoadError: A configuration file is invalid or cannot be loaded
+        """
+        json_file_paths = list(json_file_paths)
+        deprecation_warnings = self._inner.register_configs_from_json(json_file_paths)
+
+        for json_file_path, warning_msgs in zip(
+            json_file_paths, deprecation_warnings, strict=True
+        ):
+            _warn_deprecated_fields(json_file_path, warning_msgs)
 
     def spec(self, pdf_file_path: str, output_file: str) -> None:
         """Extract and write a JSON I/O spec representation of a PDF file.
@@ -136,17 +182,26 @@ class Parser:
         self._inner.py_spec_path_to_validate(spec_file_path)
 
     def test(
-        self, pdf_dir: str, output_file: str = "", log_level: str = "INFO"
+        self,
+        pdf_dir: str,
+        output_file: str = "",
+        log_level: str = "INFO",
+        workers: int | None = None,
     ) -> None:
         """Try to parse all PDFs in a given directory and sub-directories
         using the current parser configuration database. Optionally outputs
         a CSV file summarising the test results.
 
+        PDFs are parsed in parallel by worker threads sharing this parser.
+
         :param pdf_dir: Path to the directory containing PDF files to be tested
         :param output_file: Optional path to output CSV file for test results
         :param log_level: Logging level for test output (e.g., "INFO", "WARNING")
+        :param workers: Number of worker threads. Defaults to the number of CPUs.
         :return: None
 
         Note: Set log_level to "WARNING" or higher to suppress terminal output.
         """
-        run_test_protocol(pdf_dir, self, output_file, log_level)
+        run_test_protocol(
+            pdf_dir, self, output_file, log_level, workers, keep_in_memory=False
+        )
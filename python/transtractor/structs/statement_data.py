@@ -2,9 +2,45 @@
 subsequent processing in Python."""
 
 import csv
+from collections.abc import Iterator
+from itertools import repeat, starmap
+from operator import attrgetter
+from typing import Any, Literal, overload
 
 from .transaction import Transaction
 
+# Fields read from the StatementData rather than from each Transaction
+_STATEMENT_FIELDS = frozenset(
+    {
+        "key",
+        "filename",
+        "account_number",
+        "start_date",
+        "opening_balance",
+        "closing_balance",
+    }
+)
+
+# Fields read from each Transaction, in column order
+_TRANSACTION_FIELDS = ("date", "date_index", "description", "amount", "balance")
+
+# Attribute getters for each Transaction field
+_TRANSACTION_GETTERS = {field: attrgetter(field) for field in _TRANSACTION_FIELDS}
+
+# All fields that may be exported
+_VALID_FIELDS = _STATEMENT_FIELDS.union(_TRANSACTION_FIELDS)
+
+# NumPy dtypes of the fields exported as arrays by to_pandas_dict(as_arrays=True)
+_ARRAY_DTYPES = {
+    "date": "datetime64[D]",
+    "date_index": "int64",
+    "amount": "float64",
+    "balance": "float64",
+    "start_date": "int64",
+    "opening_balance": "float64",
+    "closing_balance": "float64",
+}
+
 
 def validate_fields(fields: list[str]) -> None:
     """Validate that the provided fields are valid Transaction attributes.
@@ -14,24 +50,12 @@ def validate_fields(fields: list[str]) -> None:
     :raises ValueError: If any field is not a valid
         Transaction or StatementData attribute
     """
-    valid_fields = {
-        "date",
-        "date_index",
-        "description",
-        "amount",
-        "balance",
-        "start_date",
-        "opening_balance",
-        "closing_balance",
-        "key",
-        "filename",
-        "account_number",
-    }
-    for field in fields:
-        if field not in valid_fields:
-            raise ValueError(
-                f"Invalid field: {field}. Valid fields are: {valid_fields}"
-            )
+    invalid_fields = set(fields).difference(_VALID_FIELDS)
+    if invalid_fields:
+        raise ValueError(
+            f"Invalid field(s): {sorted(invalid_fields)}. "
+            f"Valid fields are: {sorted(_VALID_FIELDS)}"
+        )
 
 
 class StatementData:
@@ -88,6 +112,49 @@ class StatementData:
             f"transactions=[{len(self._transactions)} transactions])"
         )
 
+    @classmethod
+    def _from_columns(
+        cls,
+        key: str,
+        account_number: str,
+        start_date: int,
+        opening_balance: float,
+        closing_balance: float,
+        columns: dict[str, list],
+        filename: str = "",
+    ) -> "StatementData":
+        """Create StatementData from transaction columns built by the Rust core.
+
+        :param columns: Lists of 'date' (milliseconds since epoch), 'date_index',
+            'description', 'amount' and 'balance' values, one entry per transaction
+        :type columns: dict[str, list]
+        :param filename: Filename of the parsed statement, if any
+        :type filename: str
+        :raises ValueError: If the columns differ in length
+        """
+        # Transaction converts dates and rounds values itself. Columns of unequal
+        # length would silently truncate the transactions.
+        transactions = list(
+            starmap(
+                Transaction,
+                zip(
+                    columns["date"],
+                    columns["date_index"],
+                    columns["description"],
+                    columns["amount"],
+                    columns["balance"],
+                    strict=True,
+                ),
+            )
+        )
+        # The transactions were built above, so skip their per-item type check
+        statement_data = cls(
+            key, account_number, start_date, opening_balance, closing_balance, []
+        )
+        statement_data.set_filename(filename)
+        statement_data._transactions = transactions
+        return statement_data
+
     @property
     def key(self) -> str:
         """Get the statement key."""
@@ -123,6 +190,17 @@ class StatementData:
         """Get the list of transactions."""
         return self._transactions
 
+    def _transaction_column(self, field: str) -> list:
+        """Return the values of a transaction field, one per transaction.
+
+        Built on every call in a single C-level pass, so exports follow any
+        change to the transactions.
+
+        :param field: Transaction field name
+        :type field: str
+        """
+        return list(map(_TRANSACTION_GETTERS[field], self._transactions))
+
     def set_key(self, key: str) -> None:
         """Set the key for the statement data.
 
@@ -194,12 +272,16 @@ class StatementData:
                 f"transactions must be a list, got {type(transactions).__name__}"
             )
 
-        for i, transaction in enumerate(transactions):
-            if not isinstance(transaction, Transaction):
-                raise TypeError(
-                    f"transactions[{i}] must be a Transaction instance, "
-                    f"got {type(transaction).__name__}"
-                )
+        if not all(map(isinstance, transactions, repeat(Transaction))):
+            i, transaction = next(
+                (i, transaction)
+                for i, transaction in enumerate(transactions)
+                if not isinstance(transaction, Transaction)
+            )
+            raise TypeError(
+                f"transactions[{i}] must be a Transaction instance, "
+                f"got {type(transaction).__name__}"
+            )
 
         self._transactions = transactions
 
@@ -239,27 +321,57 @@ class StatementData:
         # Validate fields
         validate_fields(list(fields))
 
-        with open(file_path, mode="w", newline="", encoding="utf-8") as csvfile:
+        # A large buffer keeps writes of long statements to a few system calls
+        with open(
+            file_path, mode="w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as csvfile:
             writer = csv.writer(csvfile)
             # Write header
             writer.writerow(fields)
             # Write transaction data
-            for transaction in self._transactions:
-                row = []
-                for field in fields:
-                    if field in {
-                        "key",
-                        "filename",
-                        "account_number",
-                        "start_date",
-                        "opening_balance",
-                        "closing_balance",
-                    }:
-                        value = getattr(self, f"_{field}", None)
-                    else:
-                        value = getattr(transaction, field, None)
-                    row.append(value)
-                writer.writerow(row)
+            writer.writerows(self._csv_rows(list(fields)))
+
+    def _csv_rows(self, fields: list[str]) -> Iterator[tuple]:
+        """Yield one CSV row of the requested fields per transaction.
+
+        Rows are zipped from an attribute getter per transaction field, with
+        each statement field repeated, so no Python code runs per row.
+
+        :param fields: Validated field names in column order
+        :type fields: list[str]
+        """
+        num_transactions = len(self._transactions)
+        return zip(
+            *[
+                repeat(getattr(self, f"_{field}"), num_transactions)
+                if field in _STATEMENT_FIELDS
+                else map(_TRANSACTION_GETTERS[field], self._transactions)
+                for field in fields
+            ],
+            strict=True,
+        )
+
+    @overload
+    def to_pandas_dict(
+        self,
+        fields: tuple[str, ...] | list[str] = ...,
+        as_arrays: Literal[False] = ...,
+    ) -> dict[str, list]: ...
+
+    @overload
+    def to_pandas_dict(
+        self,
+        fields: tuple[str, ...] | list[str] = ...,
+        *,
+        as_arrays: Literal[True],
+    ) -> dict[str, Any]: ...
+
+    @overload
+    def to_pandas_dict(
+        self,
+        fields: tuple[str, ...] | list[str],
+        as_arrays: Literal[True],
+    ) -> dict[str, Any]: ...
 
     def to_pandas_dict(
         self,
@@ -269,13 +381,20 @@ class StatementData:
             "amount",
             "balance",
         ),
-    ) -> dict[str, list]:
+        as_arrays: bool = False,
+    ) -> dict[str, Any]:
         """Convert the statement data to a dictionary suitable for pandas DataFrame.
 
         :param fields: Fields to include in the dictionary. Defaults to
             ('date', 'description', 'amount', 'balance').
-        :return: Dictionary with keys as field names and values as lists of field values
-        :rtype: dict[str, list]
+        :param as_arrays: Return date and numeric fields as typed NumPy arrays
+            rather than lists, so pandas need not infer their dtypes. Dates
+            become ``datetime64[D]``. Requires NumPy. Defaults to False.
+        :type as_arrays: bool
+        :return: Dictionary with keys as field names and values as lists (or
+            arrays) of field values
+        :rtype: dict[str, Any]
+        :raises ImportError: If as_arrays is True and NumPy is not installed
 
         Example usage::
 
@@ -288,23 +407,40 @@ class StatementData:
                 fields=['date', 'description', 'amount', 'balance', 'key']
             )
             df = pd.DataFrame(data_dict)
+
+            # Typed columns
+            df = pd.DataFrame(statement_data.to_pandas_dict(as_arrays=True))
         """
         validate_fields(list(fields))
-        data_dict = {field: [] for field in fields}
-
-        for transaction in self._transactions:
-            for field in fields:
-                if field in {
-                    "key",
-                    "filename",
-                    "account_number",
-                    "start_date",
-                    "opening_balance",
-                    "closing_balance",
-                }:
-                    value = getattr(self, f"_{field}", None)
-                else:
-                    value = getattr(transaction, field, None)
-                data_dict[field].append(value)
 
+        num_transactions = len(self._transactions)
+        if not as_arrays:
+            return {
+                field: [getattr(self, f"_{field}")] * num_transactions
+                if field in _STATEMENT_FIELDS
+                else self._transaction_column(field)
+                for field in fields
+            }
+
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("NumPy is required for as_arrays=True") from e
+
+        data_dict: dict[str, Any] = {}
+        for field in fields:
+            dtype = _ARRAY_DTYPES.get(field)
+            if field in _STATEMENT_FIELDS:
+                value = getattr(self, f"_{field}")
+                data_dict[field] = (
+                    [value] * num_transactions
+                    if dtype is None
+                    else np.full(num_transactions, value, dtype=dtype)
+                )
+            elif dtype is None:
+                data_dict[field] = self._transaction_column(field)
+            else:
+                data_dict[field] = np.array(
+                    self._transaction_column(field), dtype=dtype
+                )
         return data_dict
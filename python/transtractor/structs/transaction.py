@@ -2,7 +2,26 @@
 
 from dataclasses import dataclass
 from datetime import date as Date
-from datetime import datetime, timezone
+from functools import lru_cache
+
+# Proleptic Gregorian ordinal of the UTC calendar date of timestamp zero
+_EPOCH_ORDINAL = Date(1970, 1, 1).toordinal()
+
+# Milliseconds in a day
+_MS_PER_DAY = 86_400_000
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_to_date(timestamp: int) -> Date:
+    """Convert a timestamp in milliseconds since epoch to a date.
+
+    Timestamps from the Rust core are midnight UTC; the UTC calendar date is
+    found by whole-day integer arithmetic, so it is identical in every local
+    timezone and needs no timezone lookup. Statements repeat a few dates over
+    many transactions, so results are cached; dates are immutable and safe to
+    share.
+    """
+    return Date.fromordinal(_EPOCH_ORDINAL + timestamp // _MS_PER_DAY)
 
 
 @dataclass
@@ -32,10 +51,7 @@ class Transaction:
         :param balance: Account balance (will be rounded to 2 decimal places)
         """
         if isinstance(date, int):
-            # Convert milliseconds since epoch to date
-            # Timestamps from the Rust core are midnight UTC; convert in UTC
-            # so the calendar date is identical in every local timezone.
-            self.date = datetime.fromtimestamp(date / 1000.0, tz=timezone.utc).date()
+            self.date = _timestamp_to_date(date)
         else:
             self.date = date
         self.date_index = date_index
@@ -16,6 +16,18 @@ class LibParser:
         :raises ConfigLoadError: If the configuration file cannot be loaded
         """
 
+    def register_configs_from_json(
+        self, py_config_json_paths: list[str]
+    ) -> list[list[str]]:
+        """
+        Register multiple JSON configuration files into the parser database in a
+        single call. No configuration is registered if any file cannot be loaded.
+
+        :param py_config_json_paths: Paths to the JSON configuration files
+        :return: Deprecation warnings for each configuration file, in order
+        :raises ConfigLoadError: If any configuration file cannot be loaded
+        """
+
     def get_deprecation_warnings(self) -> list[str]:
         """
         Get deprecation warnings from the last loaded configuration.
@@ -26,12 +38,24 @@ class LibParser:
     def py_pdf_path_to_py_statement_data(self, py_pdf_path: str) -> StatementData:
         """
         Process a PDF file path from Python caller and return a Python StatementData
-        object.
+        object with its filename set to the PDF file path.
 
         :param py_pdf_path: Path to the PDF file
         :raises ParseError: If statement is not recognisable or not parsed correctly
         """
 
+    def py_pdf_paths_to_py_statement_datas(
+        self, py_pdf_paths: list[str], workers: int | None = None
+    ) -> list[StatementData | Exception]:
+        """
+        Process PDF file paths from Python caller in parallel and return, in the
+        same order, a Python StatementData object or the exception raised for each
+        file.
+
+        :param py_pdf_paths: Paths to the PDF files
+        :param workers: Number of worker threads. Defaults to the number of CPUs.
+        """
+
     def py_pdf_path_to_layout(self, py_pdf_path: str, py_layout_path: str) -> None:
         """
         Process a PDF file into layout text str.
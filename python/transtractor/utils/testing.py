@@ -2,8 +2,13 @@
 
 import csv
 import logging
-import time
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
 from pathlib import Path
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, cast
 
 from ..structs.statement_data import StatementData
@@ -68,7 +73,7 @@ class TestData:
 
     def run(self) -> None:
         """Run the test on the PDF file using the provided parser."""
-        start_total = time.time()
+        start_total = perf_counter_ns()
 
         # Try to parse the statement
         try:
@@ -83,19 +88,65 @@ class TestData:
             self.status = "FAIL"
             self.reason_failed = str(e)
 
-        end_total = time.time()
-        self.total_time = int((end_total - start_total) * 1000)
+        end_total = perf_counter_ns()
+        self.total_time = (end_total - start_total) // 1_000_000
+
+
+def _iter_files(root: str, suffix: str) -> Iterator[str]:
+    """Yield the paths of all files with a suffix in a directory and its
+    sub-directories.
+
+    Symbolic links to directories are not followed and directories that cannot
+    be read are skipped. The suffix is matched case-insensitively.
+
+    :param root: Path to the directory to search
+    :param suffix: File name suffix to match, e.g. ``".pdf"``
+    """
+    suffix = suffix.lower()
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffix):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _test_one(pdf_file: str, parser: "Parser") -> TestData:
+    """Run the test on a single PDF file."""
+    test_data = TestData(pdf_file, parser)
+    test_data.run()
+    return test_data
 
 
 def run_test_protocol(
-    pdf_dir: str, parser: "Parser", output_file: str = "", log_level: str = "INFO"
+    pdf_dir: str,
+    parser: "Parser",
+    output_file: str = "",
+    log_level: str = "INFO",
+    workers: int | None = None,
+    keep_in_memory: bool = True,
 ) -> list[TestData]:
     """Run test protocol on all PDFs in a given directory and sub-directories.
 
+    PDFs are parsed in parallel by a pool of worker threads sharing ``parser``,
+    which releases the GIL while extracting and parsing each PDF. Results are
+    logged and streamed to the output CSV in file path order as they become
+    available.
+
     :param pdf_dir: Path to the directory containing PDF files to be tested
     :param parser: Parser instance to use for testing
     :param output_file: Optional path to output CSV file for test results
     :param log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    :param workers: Number of worker threads. Defaults to the number of CPUs.
+    :param keep_in_memory: Collect and return the results. Set to False to
+        drop each result once it has been logged and written to the output CSV.
+    :return: Test results sorted by file path, or an empty list if
+        keep_in_memory is False
 
     Note: Set log_level to "WARNING" or higher to suppress terminal output.
     """
@@ -107,7 +158,7 @@ def run_test_protocol(
     logger = logging.getLogger()
 
     # Get all PDF files in the directory and sub-directories
-    pdf_files: list[str] = [str(p) for p in Path(pdf_dir).rglob("*.pdf")]
+    pdf_files: list[str] = sorted(_iter_files(str(pdf_dir), ".pdf"))
     num_files = len(pdf_files)
     num_passed = 0
     num_failed = 0
@@ -115,33 +166,46 @@ def run_test_protocol(
     log_header = "\t".join(["Test"] + TestData.get_header_log())
     logger.info(log_header)
 
-    file_count = 1
-    for pdf_file in pdf_files:
-        test_data = TestData(pdf_file, parser)
-        test_data.run()
-        test_results.append(test_data)
-        logger.info(
-            "%s/%s\t%s\t%s\t%sms\t%s",
-            file_count,
-            num_files,
-            test_data.status,
-            test_data.num_transactions,
-            test_data.total_time,
-            test_data.pdf_file_path,
-        )
-        if test_data.status == "PASS":
-            num_passed += 1
-        else:
-            num_failed += 1
-        file_count += 1
-
-    # Write results to output CSV file if specified
-    if output_file:
-        with open(output_file, mode="w", newline="", encoding="utf-8") as csvfile:
+    with ExitStack() as stack:
+        # Open output CSV file if specified and write rows as results arrive. A
+        # large buffer keeps writes to a few system calls.
+        writer = None
+        if output_file:
+            csvfile = stack.enter_context(
+                open(
+                    output_file,
+                    mode="w",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=1 << 20,
+                )
+            )
             writer = csv.writer(csvfile)
             writer.writerow(TestData.get_header_all())
-            for result in test_results:
-                writer.writerow(result.get_all())
+
+        if pdf_files:
+            max_workers = min(workers or os.cpu_count() or 1, num_files)
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+            # Workers run ahead while results are consumed in file order
+            results = executor.map(_test_one, pdf_files, repeat(parser))
+            for file_count, test_data in enumerate(results, start=1):
+                logger.info(
+                    "%s/%s\t%s\t%s\t%sms\t%s",
+                    file_count,
+                    num_files,
+                    test_data.status,
+                    test_data.num_transactions,
+                    test_data.total_time,
+                    test_data.pdf_file_path,
+                )
+                if test_data.status == "PASS":
+                    num_passed += 1
+                else:
+                    num_failed += 1
+                if writer is not None:
+                    writer.writerow(test_data.get_all())
+                if keep_in_memory:
+                    test_results.append(test_data)
 
     logger.info(
         "Summary: %s passed, %s failed out of %s files.",
@@ -1,11 +1,16 @@
 use crate::configs::registry::get_config_map;
 use crate::configs::typer::StatementTyper;
+use crate::parsers::flows::config_json_file_to_config::ConfigParseResult;
 use crate::parsers::flows::config_json_file_to_config::from_json_file;
 use crate::parsers::flows::config_json_file_to_config::from_json_str;
 use crate::parsers::flows::config_json_file_to_config::from_json_str_with_deprecations;
 use crate::structs::StatementConfig;
 use crate::structs::TextItem;
 use std::collections::HashMap;
+use std::sync::{Arc, OnceLock};
+
+/// ConfigDB built from the registry on first use, shared or cloned by each user
+static BASE_CONFIG_DB: OnceLock<Arc<ConfigDB>> = OnceLock::new();
 
 /// Struct to store or index statement configurations.
 #[derive(Debug, Clone)]
@@ -19,6 +24,19 @@ pub struct ConfigDB {
 impl ConfigDB {
     /// Initialise ConfigDB with entire registry
     pub fn new() -> Self {
+        Self::clone(&Self::shared())
+    }
+
+    /// Return the ConfigDB of the entire registry shared by the whole process. Use
+    /// `Arc::make_mut` to get a private copy before registering further configs.
+    pub fn shared() -> Arc<Self> {
+        BASE_CONFIG_DB
+            .get_or_init(|| Arc::new(Self::from_registry()))
+            .clone()
+    }
+
+    /// Build ConfigDB from the registry, compiling every config
+    fn from_registry() -> Self {
         let configs = get_config_map();
         let mut typer = StatementTyper::new();
         for cfg in configs.values() {
@@ -42,11 +60,17 @@ impl ConfigDB {
         json_str: &str,
     ) -> Result<Vec<String>, String> {
         let result = from_json_str_with_deprecations(json_str)?;
-        self.configs
-            .insert(result.config.key.clone(), result.config.clone());
+        Ok(self.register_parsed(result))
+    }
+
+    /// Add an already parsed config, overwriting any existing config with the same
+    /// key. Returns its deprecation warnings.
+    pub fn register_parsed(&mut self, result: ConfigParseResult) -> Vec<String> {
         self.typer
             .add_account_terms(&result.config.key, &result.config.account_terms);
-        Ok(result.deprecated_fields)
+        self.configs
+            .insert(result.config.key.clone(), result.config);
+        result.deprecated_fields
     }
 
     /// Add config directly from a JSON string, overwriting any existing config with the
@@ -66,10 +90,10 @@ impl ConfigDB {
         Ok(())
     }
 
-    /// Identify applicable config keys from a list of text items and return a list
-    /// of StatementConfig instances.
-    pub fn identify(&self, text_items: &Vec<TextItem>) -> Vec<StatementConfig> {
-        let keys = self.typer.identify(text_items);
+    /// Identify applicable config keys from a list of text items already split into
+    /// single word tokens and return a list of StatementConfig instances.
+    pub fn identify_tokenised(&self, tokenised_items: &[TextItem]) -> Vec<StatementConfig> {
+        let keys = self.typer.identify_tokenised(tokenised_items);
         let mut applicable_configs = Vec::new();
         for key in keys {
             if let Some(cfg) = self.configs.get(&key) {
@@ -86,3 +110,31 @@ impl ConfigDB {
         keys
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_new_is_independent_of_base() {
+        let mut db = ConfigDB::new();
+        let keys = db.get_config_keys();
+        assert!(!keys.is_empty());
+
+        let json_str = include_str!("../../tests/fixtures/test1_config.json");
+        db.register_from_str(json_str).unwrap();
+        assert_eq!(db.get_config_keys().len(), keys.len() + 1);
+        assert_eq!(ConfigDB::new().get_config_keys(), keys);
+    }
+
+    #[test]
+    fn test_make_mut_on_shared_copies_base() {
+        let mut db = ConfigDB::shared();
+        let keys = db.get_config_keys();
+
+        let json_str = include_str!("../../tests/fixtures/test1_config.json");
+        Arc::make_mut(&mut db).register_from_str(json_str).unwrap();
+        assert_eq!(db.get_config_keys().len(), keys.len() + 1);
+        assert_eq!(ConfigDB::shared().get_config_keys(), keys);
+    }
+}
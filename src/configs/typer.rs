@@ -1,6 +1,5 @@
 use crate::structs::TextItem;
 use crate::structs::text_items::get_text_item_buffer;
-use crate::structs::text_items::tokenise_items;
 use std::collections::{HashMap, HashSet};
 
 /// Struct to identify statement types from text items.
@@ -51,9 +50,9 @@ impl StatementTyper {
         self.account_terms = self.keys_by_term.keys().cloned().collect();
     }
 
-    /// Return a list of config keys whose account_terms are all found in the provided text items.
-    pub fn identify(&self, text_items: &Vec<TextItem>) -> Vec<String> {
-        let tokenised_items = tokenise_items(text_items);
+    /// Return a list of config keys whose account_terms are all found in the provided
+    /// text items, already split into single word tokens by `tokenise_items`.
+    pub fn identify_tokenised(&self, tokenised_items: &[TextItem]) -> Vec<String> {
         // Incremented for each found term found for a key
         let mut matches_by_key: HashMap<String, usize> = HashMap::new();
         // Lookup set of account_terms already encountered, to prevent double counting
@@ -67,7 +66,7 @@ impl StatementTyper {
         let mut i: usize = 0;
         while i < len {
             let buffer_size = self.max_lookahead.min(len - i);
-            let buffer = get_text_item_buffer(&tokenised_items, i, buffer_size);
+            let buffer = get_text_item_buffer(tokenised_items, i, buffer_size);
             if buffer.is_empty() {
                 break;
             }
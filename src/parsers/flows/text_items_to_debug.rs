@@ -1,11 +1,14 @@
 use crate::configs::db::ConfigDB;
-use crate::parsers::flows::text_items_to_statement_datas::text_items_to_statement_datas;
+use crate::parsers::flows::text_items_to_statement_datas::tokenised_items_to_statement_datas;
 use crate::structs::TextItem;
+use crate::structs::text_items::tokenise_items;
 
 /// Parse non-tokenised text items into debug information string,
 /// using provided statement configurations.
 pub fn text_items_to_debug(config_db: &ConfigDB, items: &Vec<TextItem>) -> Result<String, String> {
-    let configs = config_db.identify(items);
+    // Tokenise once for both identification and parsing
+    let tokenised_items = tokenise_items(items);
+    let configs = config_db.identify_tokenised(&tokenised_items);
 
     // User error: trying to parse unsupported bank statement format
     if configs.is_empty() {
@@ -16,7 +19,7 @@ pub fn text_items_to_debug(config_db: &ConfigDB, items: &Vec<TextItem>) -> Resul
     let mut output = String::new();
     output.push_str("Debug output\n");
 
-    match text_items_to_statement_datas(items, &configs, false) {
+    match tokenised_items_to_statement_datas(&tokenised_items, &configs, false) {
         Ok(statement_data_results) => {
             output.push_str(&format!(
                 "Found {} StatementData result(s)\n\n",
@@ -1,5 +1,6 @@
 use crate::configs::db::ConfigDB;
-use crate::parsers::flows::text_items_to_statement_datas::text_items_to_statement_datas;
+use crate::parsers::flows::text_items_to_statement_datas::tokenised_items_to_statement_datas;
+use crate::structs::text_items::tokenise_items;
 use crate::structs::{StatementData, TextItem};
 
 /// Top-level workflow to parse extracted text items into structured statement data
@@ -7,7 +8,9 @@ pub fn text_items_to_statement_data(
     config_db: &ConfigDB,
     items: &Vec<TextItem>,
 ) -> Result<StatementData, String> {
-    let configs = config_db.identify(items);
+    // Tokenise once for both identification and parsing
+    let tokenised_items = tokenise_items(items);
+    let configs = config_db.identify_tokenised(&tokenised_items);
 
     // User error: trying to parse unsupported bank statement format
     if configs.is_empty() {
@@ -15,7 +18,8 @@ pub fn text_items_to_statement_data(
     }
 
     // Return first error-free StatementData
-    let statement_data_results = text_items_to_statement_datas(items, &configs, true)?;
+    let statement_data_results =
+        tokenised_items_to_statement_datas(&tokenised_items, &configs, true)?;
     for data in statement_data_results {
         if data.errors.is_empty() {
             return Ok(data);
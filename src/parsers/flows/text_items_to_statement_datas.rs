@@ -4,18 +4,18 @@ use crate::parsers::top::parse_text_items;
 use crate::structs::StatementConfig;
 use crate::structs::StatementData;
 use crate::structs::TextItem;
-use crate::structs::text_items::tokenise_items;
 
-/// Extract StatementData objects from text items using provided statement configurations.
-pub fn text_items_to_statement_datas(
-    items: &Vec<TextItem>,
+/// Extract StatementData objects from text items already split into single word
+/// tokens using provided statement configurations. The same tokens are shared by
+/// every configuration.
+pub fn tokenised_items_to_statement_datas(
+    tokenised_items: &[TextItem],
     configs: &Vec<StatementConfig>,
     exit_when_succeed: bool,
 ) -> Result<Vec<StatementData>, String> {
     let mut results = Vec::new();
     for cfg in configs {
-        let tokenised_items = tokenise_items(items);
-        let mut data = parse_text_items(cfg, &tokenised_items);
+        let mut data = parse_text_items(cfg, tokenised_items);
         data.set_key(cfg.key.clone());
 
         // Apply fixers to clean up the data
@@ -0,0 +1,21 @@
+use std::time::SystemTime;
+
+/// Identifies the contents of a file by its path, modification time and size.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct FileStamp {
+    pub path: String,
+    modified: Option<SystemTime>,
+    len: u64,
+}
+
+impl FileStamp {
+    /// Stamp the file at path, or return None if it cannot be stat'ed.
+    pub fn new(path: &str) -> Option<Self> {
+        let metadata = std::fs::metadata(path).ok()?;
+        Some(Self {
+            path: path.to_string(),
+            modified: metadata.modified().ok(),
+            len: metadata.len(),
+        })
+    }
+}
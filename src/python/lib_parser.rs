@@ -1,30 +1,40 @@
 use crate::configs::db::ConfigDB;
+use crate::parsers::flows::config_json_file_to_config::{
+    ConfigParseResult, from_json_str_with_deprecations,
+};
 use crate::parsers::flows::layout_to_text_items::layout_to_text_items;
 use crate::parsers::flows::pdf_to_text_items::pdf_to_text_items;
 use crate::parsers::flows::text_items_to_debug::text_items_to_debug;
 use crate::parsers::flows::text_items_to_layout::text_items_to_layout;
 use crate::parsers::flows::text_items_to_statement_data::text_items_to_statement_data;
 use crate::python::exceptions::{ConfigLoadError, ParseError, SpecError};
+use crate::python::text_items_cache::TextItemsCache;
 use crate::python::utils;
-use crate::structs::{Spec, TextItem};
+use crate::structs::{Spec, StatementData, TextItem};
 use pdfsink_rs::PdfDocument;
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
+use rayon::prelude::*;
 use std::io::Write;
+use std::sync::{Arc, Mutex, OnceLock, RwLock};
 
-/// Helper to convert Python PDF file path to Rust text items
-fn py_pdf_path_to_text_items(py_pdf_path: &Bound<'_, PyAny>) -> PyResult<Vec<TextItem>> {
-    let rust_pdf_path = py_pdf_path.extract::<String>()?;
-    let pdf_document = PdfDocument::open(&rust_pdf_path)
+/// Helper to convert Rust PDF file path to Rust text items
+fn pdf_path_to_text_items(rust_pdf_path: &str) -> PyResult<Vec<TextItem>> {
+    let pdf_document = PdfDocument::open(rust_pdf_path)
         .map_err(|e| PyRuntimeError::new_err(format!("Failed to open PDF document: {}", e)))?;
     pdf_to_text_items(&pdf_document)
         .map_err(|e| PyRuntimeError::new_err(format!("Failed to convert PDF to text items: {}", e)))
 }
 
-/// Helper to write Rust string to text file to path specified by Python caller.
-fn str_to_file(content: String, py_file_path: &Bound<'_, PyAny>) -> PyResult<()> {
-    let rust_file_path = py_file_path.extract::<String>()?;
-    let mut file = std::fs::File::create(&rust_file_path).map_err(|e| {
+/// Helper to convert Rust layout file path to Rust text items
+fn layout_path_to_text_items(rust_layout_path: &str) -> PyResult<Vec<TextItem>> {
+    let layout_str = path_to_str(rust_layout_path)?;
+    layout_to_text_items(&layout_str).map_err(PyRuntimeError::new_err)
+}
+
+/// Helper to write Rust string to text file at a Rust path.
+fn str_to_path(content: &str, rust_file_path: &str) -> PyResult<()> {
+    let mut file = std::fs::File::create(rust_file_path).map_err(|e| {
         PyRuntimeError::new_err(format!(
             "Failed to create file at {}: {}",
             rust_file_path, e
@@ -39,20 +49,87 @@ fn str_to_file(content: String, py_file_path: &Bound<'_, PyAny>) -> PyResult<()>
     Ok(())
 }
 
-/// Helper to read string from text file to path specified by Python caller.
-fn file_to_str(py_file_path: &Bound<'_, PyAny>) -> PyResult<String> {
-    let rust_file_path = py_file_path.extract::<String>()?;
-    std::fs::read_to_string(&rust_file_path).map_err(|e| {
+/// Helper to read string from text file at a Rust path.
+fn path_to_str(rust_file_path: &str) -> PyResult<String> {
+    std::fs::read_to_string(rust_file_path).map_err(|e| {
         PyRuntimeError::new_err(format!("Failed to read file at {}: {}", rust_file_path, e))
     })
 }
 
-#[pyclass]
+/// Helper to read and parse a config JSON file at a Rust path. Parse errors are
+/// converted by parse_err.
+fn path_to_config(
+    rust_config_json_path: &str,
+    parse_err: impl FnOnce(String) -> PyErr,
+) -> PyResult<ConfigParseResult> {
+    let json_str = path_to_str(rust_config_json_path)?;
+    from_json_str_with_deprecations(&json_str).map_err(parse_err)
+}
+
+#[pyclass(frozen)]
 #[derive(Default)]
 pub struct LibParser {
-    db: ConfigDB,
+    /// Registered configs, built on first use and shared with the base ConfigDB
+    /// until a config is loaded. Loading swaps in an updated ConfigDB under the
+    /// write lock, while parses in progress keep the ConfigDB they started with.
+    db: OnceLock<RwLock<Arc<ConfigDB>>>,
     /// Last deprecation warnings from config loading
-    last_deprecation_warnings: Vec<String>,
+    last_deprecation_warnings: Mutex<Vec<String>>,
+    /// Text items of recently extracted PDF files
+    text_items_cache: TextItemsCache,
+}
+
+impl LibParser {
+    /// Get the lock guarding the registered configs, building the base ConfigDB if
+    /// not yet built.
+    fn db_lock(&self) -> &RwLock<Arc<ConfigDB>> {
+        self.db.get_or_init(|| RwLock::new(ConfigDB::shared()))
+    }
+
+    /// Get the registered configs. The read lock is only held while cloning the Arc.
+    fn db(&self) -> Arc<ConfigDB> {
+        self.db_lock()
+            .read()
+            .unwrap_or_else(|e| e.into_inner())
+            .clone()
+    }
+
+    /// Register parsed configs under the write lock, copying the current ConfigDB if
+    /// it is still shared, and return the deprecation warnings for each config in
+    /// order.
+    fn register_parsed(&self, results: Vec<ConfigParseResult>) -> Vec<Vec<String>> {
+        let mut db = self.db_lock().write().unwrap_or_else(|e| e.into_inner());
+        let db = Arc::make_mut(&mut db);
+        let warnings: Vec<Vec<String>> = results
+            .into_iter()
+            .map(|result| db.register_parsed(result))
+            .collect();
+        *self
+            .last_deprecation_warnings
+            .lock()
+            .unwrap_or_else(|e| e.into_inner()) = warnings.concat();
+        warnings
+    }
+
+    /// Convert Rust PDF file path to Rust text items, reusing the text items of a
+    /// recent extraction if the file is unchanged.
+    fn cached_pdf_path_to_text_items(&self, rust_pdf_path: &str) -> PyResult<Arc<Vec<TextItem>>> {
+        self.text_items_cache
+            .get_or_extract(rust_pdf_path, || pdf_path_to_text_items(rust_pdf_path))
+    }
+
+    /// Build a JSON spec from Rust text items and write it to a Rust path.
+    fn text_items_to_spec_path(
+        &self,
+        text_items: &[TextItem],
+        rust_spec_path: &str,
+    ) -> PyResult<()> {
+        let spec = Spec::new(&self.db(), text_items.to_vec()).map_err(ParseError::new_err)?;
+        let spec_str = spec.to_json().map_err(|e| {
+            PyRuntimeError::new_err(format!("Failed to convert Spec to JSON string: {}", e))
+        })?;
+        str_to_path(&spec_str, rust_spec_path)
+    }
 }
 
 #[pymethods]
@@ -61,130 +138,239 @@ impl LibParser {
     #[new]
     pub fn new() -> Self {
         Self {
-            db: ConfigDB::new(),
-            last_deprecation_warnings: Vec::new(),
+            db: OnceLock::new(),
+            last_deprecation_warnings: Mutex::new(Vec::new()),
+            text_items_cache: TextItemsCache::default(),
         }
     }
 
     /// Get deprecation warnings from the last loaded configuration
     pub fn get_deprecation_warnings(&self) -> Vec<String> {
-        self.last_deprecation_warnings.clone()
+        self.last_deprecation_warnings
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .clone()
     }
 
     /// Register configuration file, update the StatementTyper and return any
-    /// deprecation warnings.
+    /// deprecation warnings. Parses running on other threads finish with the configs they started with.
     pub fn register_config_from_json(
-        &mut self,
+        &self,
         py_config_json_path: &Bound<'_, PyAny>,
     ) -> PyResult<()> {
-        let json_str = file_to_str(py_config_json_path)?;
+        let rust_config_json_path = py_config_json_path.extract::<String>()?;
 
         // Clear previous warnings
-        self.last_deprecation_warnings.clear();
+        self.last_deprecation_warnings
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .clear();
 
         // Register and get deprecation warnings
-        match self.db.register_from_str_with_warnings(&json_str) {
-            Ok(warnings) => {
-                self.last_deprecation_warnings = warnings;
-                Ok(())
-            }
-            Err(e) => Err(ConfigLoadError::new_err(e)),
-        }
+        let result = path_to_config(&rust_config_json_path, ConfigLoadError::new_err)?;
+        self.register_parsed(vec![result]);
+        Ok(())
+    }
+
+    /// Register multiple configuration files in one call, update the StatementTyper
+    /// and return deprecation warnings for each file in order. No configuration is
+    /// registered if any file cannot be loaded. The files are read and parsed in
+    /// parallel with the GIL released and before the configs are locked, so parses on
+    /// other threads carry on.
+    pub fn register_configs_from_json(
+        &self,
+        py: Python<'_>,
+        py_config_json_paths: Vec<String>,
+    ) -> PyResult<Vec<Vec<String>>> {
+        // Parse every file before registering any, reporting the first error in order
+        let results = py
+            .detach(|| {
+                py_config_json_paths
+                    .par_iter()
+                    .map(|path| {
+                        path_to_config(path, |e| {
+                            ConfigLoadError::new_err(format!("{}: {}", path, e))
+                        })
+                    })
+                    .collect::<Vec<PyResult<ConfigParseResult>>>()
+            })
+            .into_iter()
+            .collect::<PyResult<Vec<ConfigParseResult>>>()?;
+
+        Ok(self.register_parsed(results))
     }
 
     /// Process a layout string and return statement data as a Python object of type
-    /// StatementData.
+    /// StatementData. The GIL is released while parsing.
     pub fn py_layout_path_to_py_statement_data(
         &self,
+        py: Python<'_>,
         py_layout_path: &Bound<'_, PyAny>,
     ) -> PyResult<Py<PyAny>> {
-        let py_layout_str = file_to_str(py_layout_path)?;
-        let text_items = layout_to_text_items(&py_layout_str).map_err(PyRuntimeError::new_err)?;
-        let data =
-            text_items_to_statement_data(&self.db, &text_items).map_err(ParseError::new_err)?;
-        utils::rust_statement_data_to_py_statement_data(&data)
+        let rust_layout_path = py_layout_path.extract::<String>()?;
+        let data = py.detach(|| {
+            let text_items = layout_path_to_text_items(&rust_layout_path)?;
+            text_items_to_statement_data(&self.db(), &text_items).map_err(ParseError::new_err)
+        })?;
+        utils::rust_statement_data_to_py_statement_data(&data, "")
     }
 
-    /// Process a PDF file path from Python caller and write layout file.
+    /// Process a PDF file path from Python caller and write layout file. The GIL is
+    /// released while extracting and writing.
     pub fn py_pdf_path_to_layout(
         &self,
+        py: Python<'_>,
         py_pdf_path: &Bound<'_, PyAny>,
         py_layout_path: &Bound<'_, PyAny>,
     ) -> PyResult<()> {
-        let text_items = py_pdf_path_to_text_items(py_pdf_path)?;
-        let layout_str = text_items_to_layout(&text_items).map_err(PyRuntimeError::new_err)?;
-        str_to_file(layout_str, py_layout_path)
+        let rust_pdf_path = py_pdf_path.extract::<String>()?;
+        let rust_layout_path = py_layout_path.extract::<String>()?;
+        py.detach(|| {
+            let text_items = self.cached_pdf_path_to_text_items(&rust_pdf_path)?;
+            let layout_str = text_items_to_layout(&text_items).map_err(PyRuntimeError::new_err)?;
+            str_to_path(&layout_str, &rust_layout_path)
+        })
     }
 
-    /// Process a PDF file path from Python caller and write debug file.
+    /// Process a PDF file path from Python caller and write debug file. The GIL is
+    /// released while extracting, parsing and writing.
     pub fn py_pdf_path_to_debug(
         &self,
+        py: Python<'_>,
         py_pdf_path: &Bound<'_, PyAny>,
         py_debug_path: &Bound<'_, PyAny>,
     ) -> PyResult<()> {
-        let text_items = py_pdf_path_to_text_items(py_pdf_path)?;
-        let debug_str = text_items_to_debug(&self.db, &text_items).map_err(ParseError::new_err)?;
-        str_to_file(debug_str, py_debug_path)
+        let rust_pdf_path = py_pdf_path.extract::<String>()?;
+        let rust_debug_path = py_debug_path.extract::<String>()?;
+        py.detach(|| {
+            let text_items = self.cached_pdf_path_to_text_items(&rust_pdf_path)?;
+            let debug_str =
+                text_items_to_debug(&self.db(), &text_items).map_err(ParseError::new_err)?;
+            str_to_path(&debug_str, &rust_debug_path)
+        })
     }
 
-    /// Process a layout string from Python caller and write debug file.
+    /// Process a layout string from Python caller and write debug file. The GIL is
+    /// released while parsing and writing.
     pub fn py_layout_path_to_debug(
         &self,
+        py: Python<'_>,
         py_layout_path: &Bound<'_, PyAny>,
         py_debug_path: &Bound<'_, PyAny>,
     ) -> PyResult<()> {
-        let py_layout_str = file_to_str(py_layout_path)?;
-        let text_items = layout_to_text_items(&py_layout_str).map_err(PyRuntimeError::new_err)?;
-        let debug_str = text_items_to_debug(&self.db, &text_items).map_err(ParseError::new_err)?;
-        str_to_file(debug_str, py_debug_path)
+        let rust_layout_path = py_layout_path.extract::<String>()?;
+        let rust_debug_path = py_debug_path.extract::<String>()?;
+        py.detach(|| {
+            let text_items = layout_path_to_text_items(&rust_layout_path)?;
+            let debug_str =
+                text_items_to_debug(&self.db(), &text_items).map_err(ParseError::new_err)?;
+            str_to_path(&debug_str, &rust_debug_path)
+        })
     }
 
-    /// Process a PDF file path from Python caller and return a Python StatementData object.
+    /// Process a PDF file path from Python caller and return a Python StatementData object
+    /// with its filename set to the PDF file path. The GIL is released while extracting
+    /// and parsing.
     pub fn py_pdf_path_to_py_statement_data(
         &self,
+        py: Python<'_>,
         py_pdf_path: &Bound<'_, PyAny>,
     ) -> PyResult<Py<PyAny>> {
-        let text_items = py_pdf_path_to_text_items(py_pdf_path)?;
-        let data =
-            text_items_to_statement_data(&self.db, &text_items).map_err(ParseError::new_err)?;
-        utils::rust_statement_data_to_py_statement_data(&data)
+        let rust_pdf_path = py_pdf_path.extract::<String>()?;
+        let data = py.detach(|| {
+            let text_items = self.cached_pdf_path_to_text_items(&rust_pdf_path)?;
+            text_items_to_statement_data(&self.db(), &text_items).map_err(ParseError::new_err)
+        })?;
+        utils::rust_statement_data_to_py_statement_data(&data, &rust_pdf_path)
     }
 
-    /// Process a PDF file path from Python caller and return a JSON spec string.
+    /// Process PDF file paths from Python caller in parallel and return, in the same
+    /// order, a Python StatementData object or the exception raised for each file.
+    /// The GIL is released while extracting and parsing. Uses the global thread pool
+    /// unless a number of worker threads is given.
+    #[pyo3(signature = (py_pdf_paths, workers=None))]
+    pub fn py_pdf_paths_to_py_statement_datas(
+        &self,
+        py: Python<'_>,
+        py_pdf_paths: Vec<String>,
+        workers: Option<usize>,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        let db = self.db();
+        let parse = |rust_pdf_path: &String| -> PyResult<StatementData> {
+            let text_items = self.cached_pdf_path_to_text_items(rust_pdf_path)?;
+            text_items_to_statement_data(&db, &text_items).map_err(ParseError::new_err)
+        };
+        let results = py.detach(|| -> PyResult<Vec<PyResult<StatementData>>> {
+            let parse_all =
+                || -> Vec<PyResult<StatementData>> { py_pdf_paths.par_iter().map(parse).collect() };
+            match workers {
+                Some(num_threads) => rayon::ThreadPoolBuilder::new()
+                    .num_threads(num_threads)
+                    .build()
+                    .map(|pool| pool.install(parse_all))
+                    .map_err(|e| {
+                        PyRuntimeError::new_err(format!("Failed to create thread pool: {}", e))
+                    }),
+                None => Ok(parse_all()),
+            }
+        })?;
+
+        results
+            .into_iter()
+            .zip(&py_pdf_paths)
+            .map(|(result, rust_pdf_path)| match result {
+                Ok(data) => utils::rust_statement_data_to_py_statement_data(&data, rust_pdf_path),
+                Err(e) => Ok(e.into_value(py).into_any()),
+            })
+            .collect()
+    }
+
+    /// Process a PDF file path from Python caller and return a JSON spec string. The
+    /// GIL is released while extracting, parsing and writing.
     pub fn py_pdf_path_to_spec(
         &self,
+        py: Python<'_>,
         py_pdf_path: &Bound<'_, PyAny>,
         py_spec_path: &Bound<'_, PyAny>,
     ) -> PyResult<()> {
-        let text_items = py_pdf_path_to_text_items(py_pdf_path)?;
-        let spec = Spec::new(&self.db, text_items).map_err(ParseError::new_err)?;
-        let spec_str = spec.to_json().map_err(|e| {
-            PyRuntimeError::new_err(format!("Failed to convert Spec to JSON string: {}", e))
-        })?;
-        str_to_file(spec_str, py_spec_path)
+        let rust_pdf_path = py_pdf_path.extract::<String>()?;
+        let rust_spec_path = py_spec_path.extract::<String>()?;
+        py.detach(|| {
+            let text_items = self.cached_pdf_path_to_text_items(&rust_pdf_path)?;
+            self.text_items_to_spec_path(&text_items, &rust_spec_path)
+        })
     }
 
     /// Process a layout file path from Python caller and return a JSON spec string.
+    /// The GIL is released while parsing and writing.
     pub fn py_layout_path_to_spec(
         &self,
+        py: Python<'_>,
         py_layout_path: &Bound<'_, PyAny>,
         py_spec_path: &Bound<'_, PyAny>,
     ) -> PyResult<()> {
-        let py_layout_str = file_to_str(py_layout_path)?;
-        let text_items = layout_to_text_items(&py_layout_str).map_err(PyRuntimeError::new_err)?;
-        let spec = Spec::new(&self.db, text_items).map_err(ParseError::new_err)?;
-        let spec_str = spec.to_json().map_err(|e| {
-            PyRuntimeError::new_err(format!("Failed to convert Spec to JSON string: {}", e))
-        })?;
-        str_to_file(spec_str, py_spec_path)
+        let rust_layout_path = py_layout_path.extract::<String>()?;
+        let rust_spec_path = py_spec_path.extract::<String>()?;
+        py.detach(|| {
+            let text_items = layout_path_to_text_items(&rust_layout_path)?;
+            self.text_items_to_spec_path(&text_items, &rust_spec_path)
+        })
     }
 
     /// Validate a JSON spec file from Python caller and return any validation errors.
-    pub fn py_spec_path_to_validate(&self, py_spec_path: &Bound<'_, PyAny>) -> PyResult<()> {
-        let spec_str = file_to_str(py_spec_path)?;
-        let spec = Spec::from_json(&spec_str).map_err(|e| {
-            PyRuntimeError::new_err(format!("Failed to parse Spec from JSON string: {}", e))
-        })?;
-        spec.validate(&self.db).map_err(SpecError::new_err)
+    /// The GIL is released while reading, parsing and validating.
+    pub fn py_spec_path_to_validate(
+        &self,
+        py: Python<'_>,
+        py_spec_path: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        let rust_spec_path = py_spec_path.extract::<String>()?;
+        py.detach(|| {
+            let spec_str = path_to_str(&rust_spec_path)?;
+            let spec = Spec::from_json(&spec_str).map_err(|e| {
+                PyRuntimeError::new_err(format!("Failed to parse Spec from JSON string: {}", e))
+            })?;
+            spec.validate(&self.db()).map_err(SpecError::new_err)
+        })
     }
 }
@@ -1,3 +1,5 @@
 pub mod exceptions;
+pub mod file_stamp;
 pub mod lib_parser;
+pub mod text_items_cache;
 pub mod utils;
@@ -0,0 +1,97 @@
+use crate::python::file_stamp::FileStamp;
+use crate::structs::TextItem;
+use std::collections::VecDeque;
+use std::sync::{Arc, Mutex};
+
+/// Small least-recently-used cache of text items extracted from files, so that
+/// repeated calls on the same unchanged file skip extraction.
+#[derive(Debug, Default)]
+pub struct TextItemsCache {
+    /// Cached entries, most recently used first
+    entries: Mutex<VecDeque<(FileStamp, Arc<Vec<TextItem>>)>>,
+}
+
+impl TextItemsCache {
+    /// Maximum number of files kept in the cache
+    const CAPACITY: usize = 8;
+
+    /// Return the cached text items for the file at path, or extract and cache
+    /// them. Files that cannot be stat'ed are extracted without caching.
+    pub fn get_or_extract<E>(
+        &self,
+        path: &str,
+        extract: impl FnOnce() -> Result<Vec<TextItem>, E>,
+    ) -> Result<Arc<Vec<TextItem>>, E> {
+        let Some(stamp) = FileStamp::new(path) else {
+            return extract().map(Arc::new);
+        };
+
+        {
+            let mut entries = self.entries.lock().unwrap_or_else(|e| e.into_inner());
+            if let Some(pos) = entries.iter().position(|(s, _)| *s == stamp) {
+                let entry = entries.remove(pos).unwrap();
+                let text_items = entry.1.clone();
+                entries.push_front(entry);
+                return Ok(text_items);
+            }
+        }
+
+        // Extract without holding the lock
+        let text_items = Arc::new(extract()?);
+        let mut entries = self.entries.lock().unwrap_or_else(|e| e.into_inner());
+        entries.retain(|(s, _)| s.path != stamp.path);
+        entries.push_front((stamp, text_items.clone()));
+        entries.truncate(Self::CAPACITY);
+        Ok(text_items)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::cell::Cell;
+
+    fn items(text: &str) -> Vec<TextItem> {
+        vec![TextItem::new(text.to_string(), 0, 0, 10, 10, 0)]
+    }
+
+    #[test]
+    fn test_get_or_extract_reuses_unchanged_file() {
+        // Name the file by process so concurrent test runs do not share it
+        let path = std::env::temp_dir().join(format!(
+            "transtractor_text_items_cache_test_{}.txt",
+            std::process::id()
+        ));
+        let path_str = path.to_str().unwrap();
+        std::fs::write(&path, "a").unwrap();
+
+        let cache = TextItemsCache::default();
+        let calls = Cell::new(0);
+        let extract = |text: &str| {
+            calls.set(calls.get() + 1);
+            Ok::<_, String>(items(text))
+        };
+
+        let first = cache.get_or_extract(path_str, || extract("a")).unwrap();
+        let second = cache.get_or_extract(path_str, || extract("a")).unwrap();
+        assert_eq!(calls.get(), 1);
+        assert!(Arc::ptr_eq(&first, &second));
+
+        // A change in size invalidates the cached entry
+        std::fs::write(&path, "bb").unwrap();
+        let third = cache.get_or_extract(path_str, || extract("bb")).unwrap();
+        assert_eq!(calls.get(), 2);
+        assert_eq!(third[0].text, "bb");
+        assert_eq!(cache.entries.lock().unwrap().len(), 1);
+
+        std::fs::remove_file(&path).unwrap();
+    }
+
+    #[test]
+    fn test_get_or_extract_does_not_cache_errors() {
+        let cache = TextItemsCache::default();
+        let result = cache.get_or_extract("does/not/exist.pdf", || Err::<Vec<TextItem>, _>("e"));
+        assert_eq!(result.unwrap_err(), "e");
+        assert!(cache.entries.lock().unwrap().is_empty());
+    }
+}
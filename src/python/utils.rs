@@ -1,19 +1,18 @@
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyList};
+use pyo3::types::{PyAny, PyDict, PyList};
 
-/// Convert a Rust StatementData to a Python StatementData object
+/// Convert a Rust StatementData to a Python StatementData object, attaching the
+/// filename of the source document (empty if none).
 pub fn rust_statement_data_to_py_statement_data(
     rust_statement_data: &crate::structs::StatementData,
+    filename: &str,
 ) -> PyResult<Py<PyAny>> {
     Python::attach(|py| {
-        // Import the Python StatementData and Transaction classes
+        // Import the Python StatementData class
         let statement_data_module = py.import("transtractor.structs.statement_data")?;
         let statement_data_class = statement_data_module.getattr("StatementData")?;
 
-        let transaction_module = py.import("transtractor.structs.transaction")?;
-        let transaction_class = transaction_module.getattr("Transaction")?;
-
         // Get key (required field)
         let key = rust_statement_data.key.as_ref().ok_or_else(|| {
             PyRuntimeError::new_err("StatementData is missing required field: key")
@@ -45,8 +44,14 @@ pub fn rust_statement_data_to_py_statement_data(
             ));
         }
 
-        // Convert proto_transactions to Transaction objects
-        let py_transactions = PyList::empty(py);
+        // Collect proto_transactions into columns, converted to Python lists in one
+        // pass each rather than one Transaction call per row
+        let num_transactions = rust_statement_data.proto_transactions.len();
+        let mut dates: Vec<i64> = Vec::with_capacity(num_transactions);
+        let mut date_indices: Vec<usize> = Vec::with_capacity(num_transactions);
+        let mut descriptions: Vec<&str> = Vec::with_capacity(num_transactions);
+        let mut amounts: Vec<f64> = Vec::with_capacity(num_transactions);
+        let mut balances: Vec<f64> = Vec::with_capacity(num_transactions);
         for proto_tx in &rust_statement_data.proto_transactions {
             // Check if the proto transaction is complete
             if !proto_tx.is_ready() {
@@ -60,29 +65,33 @@ pub fn rust_statement_data_to_py_statement_data(
                 )));
             }
 
-            // Create Python Transaction object
-            // Transaction.__init__(date: int, description: str, amount: float, balance: float)
-            let py_transaction = transaction_class.call1((
-                proto_tx.date.unwrap(),
-                proto_tx.index,
-                proto_tx.description.clone(),
-                proto_tx.amount.unwrap(),
-                proto_tx.balance.unwrap(),
-            ))?;
-
-            py_transactions.append(py_transaction)?;
+            dates.push(proto_tx.date.unwrap());
+            date_indices.push(proto_tx.index);
+            descriptions.push(proto_tx.description.as_str());
+            amounts.push(proto_tx.amount.unwrap());
+            balances.push(proto_tx.balance.unwrap());
         }
 
-        // Create Python StatementData object.
-        // filename remains unset here and is attached by the Python parser wrapper.
-        let py_statement_data = statement_data_class.call1((
-            key,
-            account_number,
-            start_date,
-            opening_balance,
-            closing_balance,
-            py_transactions,
-        ))?;
+        let columns = PyDict::new(py);
+        columns.set_item("date", PyList::new(py, dates)?)?;
+        columns.set_item("date_index", PyList::new(py, date_indices)?)?;
+        columns.set_item("description", PyList::new(py, descriptions)?)?;
+        columns.set_item("amount", PyList::new(py, amounts)?)?;
+        columns.set_item("balance", PyList::new(py, balances)?)?;
+
+        // Create Python StatementData object
+        let py_statement_data = statement_data_class.call_method1(
+            "_from_columns",
+            (
+                key,
+                account_number,
+                start_date,
+                opening_balance,
+                closing_balance,
+                columns,
+                filename,
+            ),
+        )?;
 
         Ok(py_statement_data.into())
     })
@@ -1,6 +1,7 @@
 """Tests for Parser.load() method."""
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -46,3 +47,26 @@ def test_load_emits_deprecation_warning_for_deprecated_fields():
         assert issubclass(w[1].category, DeprecationWarning)
         assert "transaction_new_line_tol" in str(w[1].message)
         assert "deprecated since v0.10.0" in str(w[1].message)
+
+
+def test_load_while_parsing_on_another_thread():
+    """Test that loading a config does not fail while another thread is parsing."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    config = str(fixtures_dir / "test1_config.json")
+    test_pdf = str(fixtures_dir / "test1.pdf")
+    parser.load(config)
+
+    # Interleave parses and loads of the same config across two threads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parses = []
+        loads = []
+        for _ in range(10):
+            parses.append(executor.submit(parser.parse, test_pdf))
+            loads.append(executor.submit(parser.load, config))
+
+    for load in loads:
+        load.result()
+    for parse in parses:
+        assert parse.result().key == "au__gtb__fake_account__1"
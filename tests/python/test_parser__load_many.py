@@ -0,0 +1,81 @@
+"""Tests for Parser.load_many() method."""
+
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from transtractor import ParseError
+from transtractor.parser import Parser
+from transtractor.transtractor import ConfigLoadError
+
+
+def test_load_many_registers_all_configs():
+    """Test that configs loaded together can be used for parsing."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    config = fixtures_dir / "test1_config.json"
+    test_pdf = fixtures_dir / "test1.pdf"
+    parser.load_many([str(config)])
+
+    statement_data = parser.parse(str(test_pdf))
+    assert statement_data.key == "au__gtb__fake_account__1"
+
+
+def test_load_many_loads_nothing_with_invalid_config():
+    """Test that one invalid config prevents all configs from loading."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    config = fixtures_dir / "test1_config.json"
+    invalid_config = fixtures_dir / "test1_config_invalid.json"
+    test_pdf = fixtures_dir / "test1.pdf"
+
+    with pytest.raises(ConfigLoadError, match="test1_config_invalid.json"):
+        parser.load_many([str(config), str(invalid_config)])
+
+    # The valid config must not have been registered either
+    with pytest.raises(ParseError):
+        parser.parse(str(test_pdf))
+
+
+def test_load_many_emits_deprecation_warnings_per_file():
+    """Test that deprecated fields are reported against the file using them."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    config = fixtures_dir / "test1_config.json"
+    deprecated_config = fixtures_dir / "test1_config_deprecated.json"
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        parser.load_many([str(config), str(deprecated_config)])
+
+        assert len(w) == 2, f"Expected 2 warnings, got {len(w)}"
+        for warning in w:
+            assert issubclass(warning.category, DeprecationWarning)
+            assert "test1_config_deprecated.json" in str(warning.message)
+
+
+def test_load_many_while_parsing_on_another_thread():
+    """Test that loading configs does not fail while another thread is parsing."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    configs = [str(fixtures_dir / "test1_config.json")] * 4
+    test_pdf = str(fixtures_dir / "test1.pdf")
+    parser.load_many(configs)
+
+    # Interleave parses and batched loads across two threads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parses = []
+        loads = []
+        for _ in range(10):
+            parses.append(executor.submit(parser.parse, test_pdf))
+            loads.append(executor.submit(parser.load_many, configs))
+
+    for load in loads:
+        load.result()
+    for parse in parses:
+        assert parse.result().key == "au__gtb__fake_account__1"
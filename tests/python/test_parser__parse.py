@@ -56,6 +56,20 @@ def test_parse_generates_correct_csv():
         Path(tmp_csv_path).unlink(missing_ok=True)
 
 
+def test_parse_sets_filename():
+    """Test that the parsed StatementData records the PDF file path."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    test_pdf = fixtures_dir / "test1.pdf"
+    config = fixtures_dir / "test1_config.json"
+    parser.load(str(config))
+
+    statement_data: StatementData = parser.parse(str(test_pdf))
+
+    assert statement_data.filename == str(test_pdf)
+
+
 def test_parse_raises_parser_error_without_config():
     """Test that parsing without loading a config raises ParseError."""
     parser = Parser()
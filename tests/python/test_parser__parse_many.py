@@ -0,0 +1,55 @@
+"""Tests for the Parser parse_many method."""
+
+from pathlib import Path
+
+from transtractor import ParseError
+from transtractor.parser import Parser
+from transtractor.structs.statement_data import StatementData
+
+
+def test_parse_many_matches_parse():
+    """Test that each result of parse_many matches parsing the file alone."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    test_pdf = str(fixtures_dir / "test1.pdf")
+    config = fixtures_dir / "test1_config.json"
+    parser.load(str(config))
+
+    results = parser.parse_many([test_pdf, test_pdf], workers=2)
+    expected = parser.parse(test_pdf)
+
+    assert len(results) == 2
+    for result in results:
+        assert isinstance(result, StatementData)
+        assert result.filename == test_pdf
+        assert result.to_pandas_dict() == expected.to_pandas_dict()
+
+
+def test_parse_many_returns_exceptions_in_place():
+    """Test that a file that cannot be parsed yields its exception in order."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    test_pdf = str(fixtures_dir / "test1.pdf")
+    missing_pdf = str(fixtures_dir / "missing.pdf")
+    config = fixtures_dir / "test1_config.json"
+    parser.load(str(config))
+
+    results = parser.parse_many([missing_pdf, test_pdf])
+
+    assert isinstance(results[0], Exception)
+    assert isinstance(results[1], StatementData)
+
+
+def test_parse_many_returns_parse_error_without_config():
+    """Test that an unsupported statement yields a ParseError."""
+    parser = Parser()
+
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    test_pdf = str(fixtures_dir / "test1.pdf")
+
+    results = parser.parse_many([test_pdf])
+
+    assert len(results) == 1
+    assert isinstance(results[0], ParseError)
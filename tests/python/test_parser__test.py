@@ -1,11 +1,13 @@
 """Tests for the Parser test method."""
 
 import csv
+import shutil
 import tempfile
 from pathlib import Path
 
 import pytest
 from transtractor.parser import Parser
+from transtractor.utils.testing import _iter_files, run_test_protocol
 
 
 def normalize_csv_for_comparison(csv_path: str, fixtures_dir: Path) -> list[list[str]]:
@@ -191,3 +193,86 @@ def test_test_raises_value_error_with_invalid_log_level():
     finally:
         # Clean up temporary file
         Path(tmp_csv_path).unlink(missing_ok=True)
+
+
+def test_iter_files_finds_nested_pdfs(tmp_path: Path):
+    """Test that PDFs in sub-directories are found with any extension case."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    for name in ["one.pdf", "a/two.PDF", "a/b/three.pdf", "a/notes.txt"]:
+        (tmp_path / name).touch()
+
+    paths = _iter_files(str(tmp_path), ".pdf")
+    found = {Path(p).relative_to(tmp_path).as_posix() for p in paths}
+
+    assert found == {"one.pdf", "a/two.PDF", "a/b/three.pdf"}
+
+
+def copy_test_pdfs(pdf_dir: Path) -> list[str]:
+    """Copy test1.pdf to several paths under pdf_dir and return them sorted."""
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    (pdf_dir / "b").mkdir()
+    paths = [pdf_dir / name for name in ["c.pdf", "a.pdf", "b/b.pdf"]]
+    for path in paths:
+        shutil.copyfile(fixtures_dir / "test1.pdf", path)
+    return sorted(str(path) for path in paths)
+
+
+def read_csv_paths(csv_path: Path) -> list[str]:
+    """Read a test protocol CSV, check its header and return its PDF File column."""
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "PDF File"
+    return [row[0] for row in rows[1:]]
+
+
+def load_test_config(parser: Parser) -> None:
+    """Load the config for test1.pdf into parser."""
+    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+    parser.load(str(fixtures_dir / "test1_config.json"))
+
+
+def test_run_test_protocol_reports_results_in_path_order(tmp_path: Path):
+    """Test that results are returned and written sorted by file path."""
+    parser = Parser()
+    load_test_config(parser)
+    pdf_dir = tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    expected = copy_test_pdfs(pdf_dir)
+    output_file = tmp_path / "results.csv"
+
+    results = run_test_protocol(
+        str(pdf_dir), parser, str(output_file), "WARNING", workers=3
+    )
+
+    assert [r.pdf_file_path for r in results] == expected
+    assert all(r.status == "PASS" for r in results)
+    assert read_csv_paths(output_file) == [Path(p).as_posix() for p in expected]
+
+
+def test_run_test_protocol_writes_all_rows_without_keeping_results(tmp_path: Path):
+    """Test that keep_in_memory=False returns nothing but still writes every row."""
+    parser = Parser()
+    load_test_config(parser)
+    pdf_dir = tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    expected = copy_test_pdfs(pdf_dir)
+    output_file = tmp_path / "results.csv"
+
+    results = run_test_protocol(
+        str(pdf_dir), parser, str(output_file), "WARNING", keep_in_memory=False
+    )
+
+    assert results == []
+    assert read_csv_paths(output_file) == [Path(p).as_posix() for p in expected]
+
+
+def test_run_test_protocol_with_one_worker(tmp_path: Path):
+    """Test that a single worker thread tests every file in order."""
+    parser = Parser()
+    load_test_config(parser)
+    expected = copy_test_pdfs(tmp_path)
+
+    results = run_test_protocol(str(tmp_path), parser, log_level="WARNING", workers=1)
+
+    assert [r.pdf_file_path for r in results] == expected
+    assert all(r.status == "PASS" for r in results)
@@ -0,0 +1,167 @@
+"""Tests for the StatementData struct."""
+
+from datetime import date as Date
+from pathlib import Path
+
+import pytest
+from transtractor.structs.statement_data import StatementData
+from transtractor.structs.transaction import Transaction
+
+FIELDS = [
+    "date",
+    "date_index",
+    "description",
+    "amount",
+    "balance",
+    "key",
+    "filename",
+    "account_number",
+]
+
+
+def make_columns() -> dict[str, list]:
+    """Build transaction columns as produced by the Rust core."""
+    return {
+        "date": [1735689600000, 1735689600000, 1735776000000],
+        "date_index": [0, 1, 0],
+        "description": ["Transaction 1", "Transaction 2", "Transaction 3"],
+        "amount": [50000.0, -1000.004, 1350.0],
+        "balance": [100000.0, 98999.996, 100350.0],
+    }
+
+
+def make_statement_data() -> StatementData:
+    """Build StatementData from transaction columns."""
+    return StatementData._from_columns(
+        "key_1", "123 456", 1735689600000, 50000.0, 100350.0, make_columns()
+    )
+
+
+def test_from_columns_builds_transactions():
+    """Test that columns are converted into equivalent Transaction objects."""
+    statement_data = make_statement_data()
+
+    assert statement_data.transactions == [
+        Transaction(Date(2025, 1, 1), 0, "Transaction 1", 50000.0, 100000.0),
+        Transaction(Date(2025, 1, 1), 1, "Transaction 2", -1000.0, 99000.0),
+        Transaction(Date(2025, 1, 2), 0, "Transaction 3", 1350.0, 100350.0),
+    ]
+
+
+def test_from_columns_raises_value_error_with_unequal_columns():
+    """Test that columns of different lengths are rejected."""
+    columns = make_columns()
+    columns["balance"].pop()
+
+    with pytest.raises(ValueError):
+        StatementData._from_columns(
+            "key_1", "123 456", 1735689600000, 50000.0, 100350.0, columns
+        )
+
+
+def test_to_pandas_dict_matches_transactions():
+    """Test that the columnar export matches exporting from Transaction objects."""
+    from_columns = make_statement_data()
+    from_columns.set_filename("statement.pdf")
+    from_transactions = StatementData(
+        "key_1",
+        "123 456",
+        1735689600000,
+        50000.0,
+        100350.0,
+        list(from_columns.transactions),
+    )
+    from_transactions.set_filename("statement.pdf")
+
+    assert from_columns.to_pandas_dict(FIELDS) == from_transactions.to_pandas_dict(
+        FIELDS
+    )
+
+
+def test_to_pandas_dict_follows_edited_transactions_from_columns():
+    """Test that edits to transactions built from columns are exported."""
+    statement_data = make_statement_data()
+    statement_data.transactions[0].description = "Edited"
+    del statement_data.transactions[1:]
+
+    assert statement_data.to_pandas_dict(["description"]) == {"description": ["Edited"]}
+
+
+def test_exports_follow_transactions_edited_between_exports(tmp_path: Path):
+    """Test that in-place edits after an export appear in later exports."""
+    transactions = [Transaction(Date(2025, 1, 1), 0, "Transaction 1", 5.0, 5.0)]
+    statement_data = StatementData(
+        "key_1", "123 456", 1735689600000, 0.0, 10.0, transactions
+    )
+    assert statement_data.to_pandas_dict()["description"] == ["Transaction 1"]
+
+    statement_data.transactions[0].description = "CLEANED"
+    statement_data.transactions.append(
+        Transaction(Date(2025, 1, 2), 0, "Transaction 2", 5.0, 10.0)
+    )
+
+    assert statement_data.to_pandas_dict()["description"] == [
+        "CLEANED",
+        "Transaction 2",
+    ]
+    csv_path = tmp_path / "statement.csv"
+    statement_data.to_csv(str(csv_path), fields=["description"])
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        "description",
+        "CLEANED",
+        "Transaction 2",
+    ]
+
+
+def test_to_pandas_dict_follows_set_transactions():
+    """Test that replacing the transactions is reflected in the export."""
+    statement_data = make_statement_data()
+    statement_data.set_transactions(statement_data.transactions[:1])
+
+    assert statement_data.to_pandas_dict() == {
+        "date": [Date(2025, 1, 1)],
+        "description": ["Transaction 1"],
+        "amount": [50000.0],
+        "balance": [100000.0],
+    }
+
+
+def test_to_pandas_dict_returns_independent_lists():
+    """Test that modifying an exported column leaves later exports unchanged."""
+    statement_data = make_statement_data()
+    statement_data.to_pandas_dict()["description"].clear()
+
+    assert len(statement_data.to_pandas_dict()["description"]) == 3
+
+
+def test_to_pandas_dict_raises_value_error_with_invalid_fields():
+    """Test that every invalid field is reported in the ValueError."""
+    statement_data = make_statement_data()
+
+    with pytest.raises(ValueError, match=r"\['bogus', 'payee'\]"):
+        statement_data.to_pandas_dict(["date", "payee", "bogus"])
+
+
+def test_set_transactions_raises_type_error_with_invalid_item():
+    """Test that the first non-Transaction item is reported by index."""
+    statement_data = make_statement_data()
+    transactions = [*statement_data.transactions, "Transaction 4"]
+
+    with pytest.raises(TypeError, match=r"transactions\[3\]"):
+        statement_data.set_transactions(transactions)
+
+
+def test_to_pandas_dict_as_arrays_returns_typed_arrays():
+    """Test that date and numeric fields are returned as typed NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    statement_data = make_statement_data()
+
+    data_dict = statement_data.to_pandas_dict(FIELDS, as_arrays=True)
+
+    assert data_dict["date"].dtype == np.dtype("datetime64[D]")
+    assert data_dict["date"].tolist() == [t.date for t in statement_data.transactions]
+    assert data_dict["date_index"].dtype == np.int64
+    assert data_dict["amount"].tolist() == [50000.0, -1000.0, 1350.0]
+    assert data_dict["balance"].dtype == np.float64
+    assert data_dict["description"] == statement_data.to_pandas_dict()["description"]
+    assert data_dict["key"] == ["key_1"] * 3
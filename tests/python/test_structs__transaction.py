@@ -47,3 +47,14 @@ def test_timestamp_conversion_is_timezone_independent():
         assert result.stdout.strip() == "2025-01-01", (
             f"Date shifted in timezone {tz}: got {result.stdout.strip()}"
         )
+
+
+def test_timestamp_conversion_ignores_time_of_day():
+    """Test that timestamps within a UTC day, or before the epoch, map to that day."""
+    # One millisecond before 2025-01-02T00:00:00Z
+    transaction = Transaction(1735775999999, 0, "Transaction 1", 0.0, 0.0)
+    assert transaction.date == Date(2025, 1, 1)
+
+    # One millisecond before 1970-01-01T00:00:00Z
+    transaction = Transaction(-1, 0, "Transaction 1", 0.0, 0.0)
+    assert transaction.date == Date(1969, 12, 31)